@@ -15,15 +15,13 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-from __future__ import absolute_import
-
 import os
 import logging
 
-from .tborg import ThunderBorg, ThunderBorgException
+from .tborg import ThunderBorg, ThunderBorgException, ThunderBorgStatus
 
 __all__ = ['create_working_dir', 'ConfigLogger', 'ThunderBorg',
-           'ThunderBorgException']
+           'ThunderBorgException', 'ThunderBorgStatus']
 
 # Some file locations, but can only be imported after create_working_dir()
 # is run.
@@ -16,16 +16,14 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-from __future__ import absolute_import
-
 __docformat__ = "restructuredtext en"
 
+import io
 import os
 import sys
 import time
 import logging
 import pygame
-import six
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
     os.path.abspath(__file__))))
@@ -323,7 +321,7 @@ class JoyStickControl(PYGameController, Daemon):
         level_min, level_max = self._tb.get_battery_monitoring_limits()
         current_level = self._tb.get_battery_voltage()
         mid_level = (level_min + level_max) / 2
-        buf = six.StringIO()
+        buf = io.StringIO()
         buf.write("\nBattery Monitoring Settings\n")
         buf.write("---------------------------\n")
         buf.write("Minimum (red)    {:02.2f} V\n".format(level_min))
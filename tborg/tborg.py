@@ -15,23 +15,134 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-from __future__ import absolute_import
-
 __docformat__ = "restructuredtext en"
 
-import io
+import os
+import asyncio
+import errno
+import collections
+import ctypes
 import fcntl
-import types
+import functools
+import inspect
 import time
 import logging
-import six
+import struct
+import threading
 
-_LEVEL_TO_NAME = logging._levelNames if six.PY2 else logging._levelToName
+_LEVEL_TO_NAME = logging._levelToName
 
 class ThunderBorgException(Exception):
     pass
 
 
+ThunderBorgStatus = collections.namedtuple(
+    'ThunderBorgStatus', ('fault_one', 'fault_two', 'failsafe', 'voltage'))
+ThunderBorgStatus.__doc__ = """
+The board status returned by `ThunderBorg.get_status`.
+"""
+
+
+class _I2cMsg(ctypes.Structure):
+    """
+    The Linux ``struct i2c_msg`` used by the ``I2C_RDWR`` ioctl.
+    """
+    _fields_ = [('addr', ctypes.c_uint16),
+                ('flags', ctypes.c_uint16),
+                ('len', ctypes.c_uint16),
+                ('buf', ctypes.POINTER(ctypes.c_uint8))]
+
+
+class _I2cRdwrIoctlData(ctypes.Structure):
+    """
+    The Linux ``struct i2c_rdwr_ioctl_data`` used by the ``I2C_RDWR`` ioctl.
+    """
+    _fields_ = [('msgs', ctypes.POINTER(_I2cMsg)),
+                ('nmsgs', ctypes.c_uint32)]
+
+
+def _clip8(value):
+    """
+    Clamp an integer to the range of an unsigned byte.
+    """
+    return 0 if value < 0 else (0xFF if value > 0xFF else value)
+
+
+def _to_byte(value):
+    """
+    Truncate a number to an integer and clamp it to an unsigned byte.
+    Integers, the common case, skip the ``int()`` conversion.
+    """
+    return _clip8(value if type(value) is int else int(value))
+
+
+def _i2c_guard(msg):
+    """
+    Decorator that logs and converts an `IOError` raised while talking to
+    the `ThunderBorg`, or the `ValueError` raised when the device has been
+    closed, into a `ThunderBorgException`.
+
+    :param msg: The error message, it is formatted with the exception
+                followed by the arguments of the decorated method, in the
+                order of its signature however they were passed.
+    :type msg: str
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        def error_message(self, e, args, kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            return msg.format(e, *tuple(bound.arguments.values())[1:])
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def wrapper(self, *args, **kwargs):
+                try:
+                    return await method(self, *args, **kwargs)
+                except KeyboardInterrupt as e: # pragma: no cover
+                    self._log.warning("Keyboard interrupt, %s", e)
+                    raise
+                except (IOError, ValueError) as e: # pragma: no cover
+                    err_msg = error_message(self, e, args, kwargs)
+                    self._log.error(err_msg)
+                    raise ThunderBorgException(err_msg)
+        else:
+            @functools.wraps(method)
+            def wrapper(self, *args, **kwargs):
+                try:
+                    return method(self, *args, **kwargs)
+                except KeyboardInterrupt as e: # pragma: no cover
+                    self._log.warning("Keyboard interrupt, %s", e)
+                    raise
+                except (IOError, ValueError) as e: # pragma: no cover
+                    err_msg = error_message(self, e, args, kwargs)
+                    self._log.error(err_msg)
+                    raise ThunderBorgException(err_msg)
+
+        return wrapper
+
+    return decorator
+
+
+def _bus_access(method):
+    """
+    Decorator for the methods that do I/O on the I²C bus. The bus lock is
+    held for the whole transaction, so the background poller and the
+    caller never interleave, and a pending EEPROM write is waited for
+    first so the board is not addressed while it is busy.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._io_lock:
+            if self._eeprom_pending is not None:
+                self._sync_eeprom()
+
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class ThunderBorg(object):
     """
     This module is designed to communicate with the ThunderBorg motor
@@ -41,6 +152,12 @@ class ThunderBorg(object):
     #   :members:
     #
     # sudo i2cdetect -y 1
+    __slots__ = ('_log', '_i2c_fd', '_address', '_read_cache', '_rx_buf',
+                 '_read_ioctls', '_tx_buf', '_last_batt_limits',
+                 '_failsafe_state', '_eeprom_pending', '_snapshot',
+                 '_poll_thread', '_poll_stop', '_poll_max_age', '_io_lock',
+                 '_combined_reads',
+                 '_volt_alpha', '_volt_sample', '_volt_ewma')
     _DEF_LOG_LEVEL = logging.WARNING
     _DEVICE_PREFIX = '/dev/i2c-{}'
     DEFAULT_BUS_NUM = 1 # Rev. 2 boards
@@ -50,8 +167,35 @@ class ThunderBorg(object):
     _POSSIBLE_BUSS = [0, 1]
     _I2C_ID_THUNDERBORG = 0x15
     _I2C_SLAVE = 0x0703
+    _I2C_RDWR = 0x0707
+    _I2C_M_RD = 0x0001
+    _I2C_RDWR_MAX_MSGS = 42
+    # Seconds to back off before retrying a failed read, it is multiplied
+    # by the attempt number.
+    _I2C_RETRY_BACKOFF = 0.0005
+    # Seconds after an EEPROM write before the board is addressed again,
+    # the fixed delay of the original driver, then between the read back
+    # checks and the longest wait from the write.
+    _EEPROM_SETTLE = 0.2
+    _EEPROM_POLL = 0.001
+    _EEPROM_TIMEOUT = 0.25
+    # Polled replies older than this many intervals are not used.
+    _POLL_STALE_INTERVALS = 3
+    # SCHED_FIFO priority used by set_io_affinity.
+    _IO_RT_PRIORITY = 50
+    # Errors returned when nothing acknowledges an address.
+    _I2C_NO_ACK = (errno.ENXIO, errno.EREMOTEIO, errno.EIO)
+    # Address ranges where a quick write can corrupt EEPROMs, these are
+    # probed with a one byte read instead, the same as i2cdetect.
+    _I2C_READ_PROBE = (range(0x30, 0x38), range(0x50, 0x60))
     _I2C_READ_LEN = 6
+    _I2C_WRITE_LEN = 5
+    # Precompiled packers for the fixed size motor and LED frames.
+    _PACK_MOTOR = struct.Struct('BB')
+    _PACK_LED = struct.Struct('BBBB')
+    _PACK_EXTERNAL_LED = struct.Struct('BBBBB')
     _PWM_MAX = 255
+    _INV_PWM_MAX = 1 / _PWM_MAX
     _VOLTAGE_PIN_MAX = 36.3
     """Maximum voltage from the analog voltage monitoring pin"""
     _VOLTAGE_PIN_CORRECTION = 0.0
@@ -132,6 +276,53 @@ class ThunderBorg(object):
     """I²C value representing on"""
     COMMAND_ANALOG_MAX = 0x3FF
     """Maximum value for analog readings"""
+    # Commands that are read together in one transaction whenever one of
+    # them has to be read from the board.
+    _READ_GROUPS = {
+        COMMAND_GET_DRIVE_A_FAULT: (COMMAND_GET_DRIVE_A_FAULT,
+                                    COMMAND_GET_DRIVE_B_FAULT),
+        COMMAND_GET_DRIVE_B_FAULT: (COMMAND_GET_DRIVE_A_FAULT,
+                                    COMMAND_GET_DRIVE_B_FAULT),
+        }
+    # Commands read together by get_motors.
+    _MOTOR_COMMANDS = (COMMAND_GET_A, COMMAND_GET_B)
+    # Commands read together by get_status.
+    _STATUS_COMMANDS = (COMMAND_GET_DRIVE_A_FAULT, COMMAND_GET_DRIVE_B_FAULT,
+                        COMMAND_GET_FAILSAFE, COMMAND_GET_BATT_VOLT)
+    # Payloads for the on/off commands indexed by state.
+    _STATE_BYTES = (bytes((COMMAND_VALUE_OFF,)), bytes((COMMAND_VALUE_ON,)))
+    # Prebuilt single byte transmit buffers for the read commands, they
+    # are never written to so all instances can share them.
+    _CMD_FRAMES = {command: (ctypes.c_uint8 * 1)(command)
+                   for command in (COMMAND_GET_LED1, COMMAND_GET_LED2,
+                                   COMMAND_GET_LED_BATT_MON, COMMAND_GET_A,
+                                   COMMAND_GET_B, COMMAND_GET_DRIVE_A_FAULT,
+                                   COMMAND_GET_DRIVE_B_FAULT,
+                                   COMMAND_GET_FAILSAFE,
+                                   COMMAND_GET_BATT_VOLT,
+                                   COMMAND_GET_BATT_LIMITS, COMMAND_GET_ID)}
+    POLL_COMMANDS = (COMMAND_GET_DRIVE_A_FAULT, COMMAND_GET_DRIVE_B_FAULT,
+                     COMMAND_GET_BATT_VOLT)
+    """Default commands read by the background poller"""
+    _VOLT_SCALE = _VOLTAGE_PIN_MAX / COMMAND_ANALOG_MAX
+    _BATT_LIMIT_SCALE = _VOLTAGE_PIN_MAX / 0xFF
+    # Seconds a reply stays fresh in the read cache.
+    _READ_CACHE_TTL = {
+        COMMAND_GET_LED_BATT_MON: 0.05,
+        COMMAND_GET_DRIVE_A_FAULT: 0.02,
+        COMMAND_GET_DRIVE_B_FAULT: 0.02,
+        COMMAND_GET_FAILSAFE: 0.05,
+        COMMAND_GET_BATT_VOLT: 0.1,
+        COMMAND_GET_BATT_LIMITS: 0.05,
+        }
+    # Motor number for the motor read commands.
+    _MOTOR_ID = {
+        COMMAND_GET_A: 1,
+        COMMAND_GET_B: 2,
+        }
+    # Instances shared by the class method scans, keyed by logger name.
+    _scratch_tbs = {}
+    _scratch_lock = threading.Lock()
 
     def __init__(self,
                  bus_num=DEFAULT_BUS_NUM,
@@ -139,7 +330,8 @@ class ThunderBorg(object):
                  logger_name='',
                  log_level=_DEF_LOG_LEVEL,
                  auto_set_addr=False,
-                 static_init=False):
+                 static_init=False,
+                 voltage_ewma_alpha=None):
         """
         Setup logging and initialize the ThunderBorg motor driver board.
 
@@ -157,9 +349,16 @@ class ThunderBorg(object):
         :type auto_set_addr: bool
         :param static_init: If called by a public class method.
         :type static_init: bool
+        :param voltage_ewma_alpha: Smooth the battery voltage with an
+                                   exponentially weighted moving average
+                                   using this weight, between 0.0 and 1.0,
+                                   for each new sample. Default is `None`
+                                   to return the raw voltage.
+        :type voltage_ewma_alpha: float
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream or an
-                                      invalid address or bus was provided.
+                                      invalid address, bus, or voltage
+                                      weight was provided.
         """
         # Setup logging
         if logger_name == '':
@@ -167,6 +366,39 @@ class ThunderBorg(object):
 
         self._log = logging.getLogger(logger_name)
         self._log.setLevel(log_level)
+        # A closed descriptor makes any I/O fail with EBADF, so the I/O
+        # methods need no guard of their own.
+        self._i2c_fd = -1
+        self._address = address
+        self._read_cache = {}
+        self._rx_buf = bytearray(self._I2C_READ_LEN)
+        # Prebuilt read transactions into the receive buffer, keyed by
+        # command and length.
+        self._read_ioctls = {}
+        self._tx_buf = bytearray(self._I2C_WRITE_LEN)
+        self._last_batt_limits = None
+        self._failsafe_state = None
+        # The `(command, expected)` read back of an EEPROM write the board
+        # may still be storing.
+        self._eeprom_pending = None
+        self._snapshot = {}
+        self._poll_thread = None
+        self._poll_stop = threading.Event()
+        self._poll_max_age = 0.0
+        # Reentrant since waiting for an EEPROM write reads the board.
+        self._io_lock = threading.RLock()
+        # Cleared when the adapter refuses several reads in one ioctl.
+        self._combined_reads = True
+
+        if voltage_ewma_alpha is not None and not 0 < voltage_ewma_alpha <= 1:
+            msg = (f"Invalid voltage EWMA weight {voltage_ewma_alpha}, must "
+                   "be greater than 0.0 and at most 1.0.")
+            self._log.error(msg)
+            raise ThunderBorgException(msg)
+
+        self._volt_alpha = voltage_ewma_alpha
+        self._volt_sample = None
+        self._volt_ewma = None
 
         if not static_init:
             self._initialize_board(bus_num, address, auto_set_addr)
@@ -176,9 +408,9 @@ class ThunderBorg(object):
 
     def _initialize_board(self, bus_num, address, auto_set_addr):
         """
-        Setup the I²C connections and file streams for read and write. If
-        the default board cannot be found search for a board and if
-        ``auto_set_addr`` is ``True`` configure the found board.
+        Setup the I²C connection and open the bus device. If the default
+        board cannot be found search for a board and if ``auto_set_addr``
+        is ``True`` configure the found board.
         """
         if not self._is_thunder_borg_board(bus_num, address, self):
             err_msg = "ThunderBorg not found on bus %s at address 0x%02X"
@@ -187,11 +419,15 @@ class ThunderBorg(object):
                     if not auto_set_addr and bus != bus_num]
             found_chip = False
 
+            # Stop at the first bus with the board, a later scan would
+            # close its descriptor.
             for bus in buss:
                 found_chip = self._is_thunder_borg_board(bus, address, self)
 
-                if not found_chip:
-                    self._log.error(err_msg, bus, address)
+                if found_chip:
+                    break
+
+                self._log.error(err_msg, bus, address)
 
             if (not found_chip
                 and (not auto_set_addr or
@@ -201,19 +437,54 @@ class ThunderBorg(object):
                        "attached, the correct address used, and the I2C "
                        "driver module loaded?")
                 self._log.critical(msg)
+                self.close_streams()
                 raise ThunderBorgException(msg)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close_streams()
+
+    def __del__(self):
+        # Last resort for an instance dropped without close_streams, the
+        # raw descriptor is not closed by the garbage collector.
+        if getattr(self, '_i2c_fd', -1) >= 0:
+            try:
+                os.close(self._i2c_fd)
+            except OSError: # pragma: no cover
+                pass
+
     #
     # Class Methods
     #
 
+    @classmethod
+    def _scratch_instance(cls, logger_name):
+        """
+        Return the instance used by the class method scans for the given
+        logger, it is only created the first time. The caller must hold
+        `_scratch_lock` and close its streams when it is done.
+        """
+        tb = cls._scratch_tbs.get(logger_name)
+
+        if tb is None:
+            tb = ThunderBorg(logger_name=logger_name, log_level=logging.INFO,
+                             static_init=True)
+            cls._scratch_tbs[logger_name] = tb
+
+        return tb
+
     @classmethod
     def _is_thunder_borg_board(cls, bus_num, address, tb):
         """
         Try to initialize a board on a given bus and address.
         """
-        tb._log.debug("Loading ThunderBorg on bus number %d, address 0x%02X",
-                      cls.DEFAULT_BUS_NUM, address)
+        log = tb._log
+
+        log.debug("Loading ThunderBorg on bus number %d, address 0x%02X",
+                  bus_num, address)
+
         found_chip = False
 
         if cls._init_bus(bus_num, address, tb):
@@ -221,13 +492,17 @@ class ThunderBorg(object):
                 recv = tb._read(cls.COMMAND_GET_ID, cls._I2C_READ_LEN)
             except KeyboardInterrupt as e: # pragma: no cover
                 tb.close_streams()
-                tb._log.warning("Keyboard interrupt, %s", e)
-                raise e
+                log.warning("Keyboard interrupt, %s", e)
+                raise
             except IOError as e:
                 pass
             else:
                 found_chip = cls._check_board_chip(recv, bus_num, address, tb)
 
+            # Don't keep a descriptor for an address without the board.
+            if not found_chip:
+                tb.close_streams()
+
         return found_chip
 
     @classmethod
@@ -238,29 +513,73 @@ class ThunderBorg(object):
         """
         device_found = False
         device = cls._DEVICE_PREFIX.format(bus_num)
+        # Don't leak the descriptor from a previous address.
+        tb.close_streams()
 
         try:
-            tb._i2c_read = io.open(device, mode='rb', buffering=0)
-            tb._i2c_write = io.open(device, mode='wb', buffering=0)
+            tb._i2c_fd = os.open(device, os.O_RDWR)
         except (IOError, OSError) as e: # pragma: no cover
             tb.close_streams()
-            msg = ("Could not open read or write stream on bus {:d} at "
-                   "address 0x{:02X}, {}").format(bus_num, address, e)
+            msg = (f"Could not open the I²C device on bus {bus_num:d} "
+                   f"at address 0x{address:02X}, {e}")
             tb._log.critical(msg)
         else:
             try:
-                fcntl.ioctl(tb._i2c_read, cls._I2C_SLAVE, address)
-                fcntl.ioctl(tb._i2c_write, cls._I2C_SLAVE, address)
+                fcntl.ioctl(tb._i2c_fd, cls._I2C_SLAVE, address)
             except (IOError, OSError) as e: # pragma: no cover
                 tb.close_streams()
-                msg = ("Failed to initialize ThunderBorg on bus number {:d}, "
-                       "address 0x{:02X}, {}").format(bus_num, address, e)
+                msg = ("Failed to initialize ThunderBorg on bus number "
+                       f"{bus_num:d}, address 0x{address:02X}, {e}")
                 tb._log.critical(msg)
             else:
+                tb._address = address
+                tb._read_ioctls.clear()
                 device_found = True
 
         return device_found
 
+    @classmethod
+    def _probe_bus(cls, bus_num, tb):
+        """
+        Probe every address on the bus with a single message transaction
+        and return the addresses that acknowledged it. If the bus cannot
+        be opened no addresses are returned.
+        """
+        found = []
+        device = cls._DEVICE_PREFIX.format(bus_num)
+
+        try:
+            fd = os.open(device, os.O_RDWR)
+        except (IOError, OSError) as e: # pragma: no cover
+            msg = f"Could not open the I²C device on bus {bus_num:d}, {e}"
+            tb._log.critical(msg)
+            return found
+
+        buf = (ctypes.c_uint8 * 1)()
+
+        try:
+            for address in range(0x03, 0x77, 1):
+                if any(address in r for r in cls._I2C_READ_PROBE):
+                    msg = _I2cMsg(address, cls._I2C_M_RD, 1, buf)
+                else:
+                    msg = _I2cMsg(address, 0, 0, buf)
+
+                ioctl_data = _I2cRdwrIoctlData(ctypes.pointer(msg), 1)
+
+                try:
+                    fcntl.ioctl(fd, cls._I2C_RDWR, ioctl_data)
+                except (IOError, OSError) as e:
+                    # Adapters that cannot do the probe are checked the
+                    # long way.
+                    if e.errno in cls._I2C_NO_ACK:
+                        continue
+
+                found.append(address)
+        finally:
+            os.close(fd)
+
+        return found
+
     @classmethod
     def _check_board_chip(cls, recv, bus_num, address, tb):
         found_chip = False
@@ -313,17 +632,29 @@ class ThunderBorg(object):
         :param tb: Use a pre-existing ThunderBorg instance. Default is `None`.
         :type tb: ThunderBorg instance
         :param close: Default is `True` to close the stream before exiting.
+                      The stream is always closed when `tb` is `None`.
         :type close: bool
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
+        if not tb:
+            with cls._scratch_lock:
+                tb = cls._scratch_instance(logger_name)
+
+                # Nothing else can use the scratch device, close it even
+                # when the scan failed part way.
+                try:
+                    return cls.find_board(bus_num=bus_num, tb=tb,
+                                          close=close)
+                finally:
+                    tb.close_streams()
+
         found = []
-        if not tb: tb = ThunderBorg(logger_name=logger_name,
-                                    log_level=logging.INFO,
-                                    static_init=True)
         tb._log.info("Scanning I2C bus number %d.", bus_num)
 
-        for address in range(0x03, 0x77, 1):
+        # Only the addresses that acknowledge the quick probe get the full
+        # board ID check.
+        for address in cls._probe_bus(bus_num, tb):
             if cls._is_thunder_borg_board(bus_num, address, tb):
                 found.append(address)
 
@@ -360,9 +691,16 @@ class ThunderBorg(object):
         :raises ThunderBorgException: An error happened on a stream or
                                       failed to set the new address.
         """
-        tb = ThunderBorg(log_level=logging.INFO, logger_name=logger_name,
-                         static_init=True)
+        with cls._scratch_lock:
+            tb = cls._scratch_instance(logger_name)
 
+            try:
+                cls._set_i2c_address(new_addr, cur_addr, bus_num, tb)
+            finally:
+                tb.close_streams()
+
+    @classmethod
+    def _set_i2c_address(cls, new_addr, cur_addr, bus_num, tb):
         if not (0x03 <= new_addr <= 0x77):
             msg = ("Error, I2C addresses must be in the range "
                    "of 0x03 to 0x77")
@@ -389,15 +727,15 @@ class ThunderBorg(object):
             except KeyboardInterrupt as e: # pragma: no cover
                 tb.close_streams()
                 tb._log.warning("Keyboard interrupt, %s", e)
-                raise e
+                raise
             except IOError as e: # pragma: no cover
                 tb.close_streams()
-                msg = "Missing ThunderBorg at address 0x%02X."
-                tb._log.error(msg, cur_addr)
+                msg = f"Missing ThunderBorg at address 0x{cur_addr:02X}."
+                tb._log.error(msg)
                 raise ThunderBorgException(msg)
             else:
                 if cls._check_board_chip(recv, bus_num, cur_addr, tb):
-                    tb._write(cls.COMMAND_SET_I2C_ADD, [new_addr])
+                    tb._write(cls.COMMAND_SET_I2C_ADD, bytes((new_addr,)))
                     time.sleep(0.1)
                     msg = ("Address changed to 0x%02X, attempting to talk "
                            "with the new address.")
@@ -410,22 +748,22 @@ class ThunderBorg(object):
                         except KeyboardInterrupt as e: # pragma: no cover
                             tb.close_streams()
                             tb._log.warning("Keyboard interrupt, %s", e)
-                            raise e
+                            raise
                         except IOError as e: # pragma: no cover
                             tb.close_streams()
-                            msg = ("Missing ThunderBorg at address 0x{:02X}."
-                                   ).format(new_addr)
+                            msg = ("Missing ThunderBorg at address "
+                                   f"0x{new_addr:02X}.")
                             tb._log.error(msg)
                             raise ThunderBorgException(msg)
                         else:
                             if cls._check_board_chip(recv, bus_num,
                                                      new_addr, tb):
-                                msg = ("New I2C address of 0x{:02X} set "
-                                       "successfully.").format(new_addr)
-                                tb._log.info(msg)
+                                msg = ("New I2C address of 0x%02X set "
+                                       "successfully.")
+                                tb._log.info(msg, new_addr)
                             else: # pragma: no cover
-                                msg = ("Failed to set address to 0x{:02X}"
-                                       ).format(new_addr)
+                                msg = ("Failed to set address to "
+                                       f"0x{new_addr:02X}")
                                 tb._log.error(msg)
                                 raise ThunderBorgException(msg)
 
@@ -437,51 +775,261 @@ class ThunderBorg(object):
 
     def close_streams(self):
         """
-        Close both streams if the ThunderBorg was not found and when we
-        are shutting down. We don't want memory leaks.
+        Close the I²C device if the ThunderBorg was not found and when we
+        are shutting down. We don't want file descriptor leaks. A pending
+        EEPROM write is waited for before the device is closed.
         """
-        if hasattr(self, '_i2c_read'):
-            self._i2c_read.close()
-            self._log.debug("I2C read stream is now closed.")
+        self.stop_polling()
+
+        # Don't close the device in the middle of a transaction.
+        with self._io_lock:
+            pending = self._eeprom_pending
+
+            # Let the board store a pending EEPROM write first, a new
+            # instance could otherwise address it while it is busy.
+            if pending is not None and self._i2c_fd >= 0:
+                try:
+                    self._sync_eeprom()
+                except (IOError, ValueError) as e:
+                    self._log.warning("Failed waiting for the EEPROM "
+                                      "write, %s", e)
+                    delay = (pending[2] + self._EEPROM_TIMEOUT
+                             - time.monotonic())
+
+                    if delay > 0:
+                        time.sleep(delay)
+
+            self._eeprom_pending = None
+
+            if self._i2c_fd >= 0:
+                os.close(self._i2c_fd)
+                self._i2c_fd = -1
+
+                self._log.debug("I2C device is now closed.")
+
+    def start_polling(self, interval=0.05, commands=POLL_COMMANDS):
+        """
+        Start a background thread that reads the given commands every
+        `interval` seconds. While it runs the matching getters return the
+        latest polled value without touching the I²C bus, so a control
+        loop is not held up by these reads.
+
+        .. note::
+
+           The getters fall back to reading the board until the first
+           poll has finished, and when the last poll of a command failed
+           or is older than three intervals.
+
+        :param interval: Seconds between polls, defaults to 0.05.
+        :type interval: float
+        :param commands: The `COMMAND_GET_*` values to poll, defaults to
+                         `POLL_COMMANDS`, the drive faults and the battery
+                         voltage.
+        :type commands: tuple
+        """
+        self.stop_polling()
+        self._poll_stop.clear()
+        self._poll_max_age = interval * self._POLL_STALE_INTERVALS
+        self._poll_thread = threading.Thread(
+            target=self._poll, args=(interval, tuple(commands)),
+            name="ThunderBorgPoller")
+        self._poll_thread.daemon = True
+        self._poll_thread.start()
+        self._log.debug("Started polling commands %s every %s seconds.",
+                        commands, interval)
+
+    def stop_polling(self):
+        """
+        Stop the background thread started with `start_polling`, the
+        getters will read from the board again.
+        """
+        if self._poll_thread is not None:
+            self._poll_stop.set()
+            self._poll_thread.join()
+            self._poll_thread = None
+            self._snapshot.clear()
+            self._log.debug("Stopped polling.")
+
+    def _poll(self, interval, commands):
+        # The poller has its own receive buffer so that it never
+        # overwrites a reply the caller is still looking at.
+        out = bytearray(self._I2C_READ_LEN)
+        failed = set()
+
+        while not self._poll_stop.is_set():
+            # Leave the waiting for an EEPROM write to the caller.
+            if self._eeprom_pending is None:
+                for command in commands:
+                    try:
+                        recv = self._read(command, self._I2C_READ_LEN,
+                                          out=out)
+                    except (IOError, ValueError) as e:
+                        # Never serve the reply from before the failure
+                        # and only log the first failure in a row.
+                        self._snapshot.pop(command, None)
+
+                        if command not in failed:
+                            failed.add(command)
+                            self._log.error("Failed polling command %d, %s",
+                                            command, e)
+                    else:
+                        self._snapshot[command] = (time.monotonic(),
+                                                   bytearray(recv))
+
+                        if command in failed:
+                            failed.discard(command)
+                            self._log.info("Polling command %d recovered.",
+                                           command)
+
+            self._poll_stop.wait(interval)
+
+    def set_io_affinity(self, cpu_id=None, realtime=False):
+        """
+        Tune the scheduling of the calling thread, call it from the thread
+        that talks to the `ThunderBorg`.
 
-        if hasattr(self, '_i2c_write'):
-            self._i2c_write.close()
-            self._log.debug("I2C write stream is now closed.")
+        .. note::
+
+           1. On a multi-core Pi pinning the thread to a core of its own
+              keeps the I²C transactions from being delayed by other work.
+           2. With `realtime` the thread runs under the ``SCHED_FIFO``
+              scheduler so it is not preempted in the middle of a
+              transaction, this helps on a single core Pi Zero too. It
+              needs root or the ``CAP_SYS_NICE`` capability.
+
+        :param cpu_id: The CPU to pin the thread to. Default is `None` to
+                       leave the affinity alone.
+        :type cpu_id: int
+        :param realtime: Run the thread with the ``SCHED_FIFO`` scheduler.
+                         Default is ``False``.
+        :type realtime: bool
+        :raises ThunderBorgException: If the affinity or scheduler could not
+                                      be set.
+        """
+        try:
+            if cpu_id is not None:
+                os.sched_setaffinity(0, (cpu_id,))
+
+            if realtime:
+                os.sched_setscheduler(0, os.SCHED_FIFO,
+                                      os.sched_param(self._IO_RT_PRIORITY))
+        except (OSError, ValueError, OverflowError) as e:
+            msg = f"Failed setting the I/O thread scheduling, {e}"
+            self._log.error(msg)
+            raise ThunderBorgException(msg)
 
+    @_bus_access
     def _write(self, command, data):
         """
         Write data to the `ThunderBorg`.
 
         :param command: Command to send to the `ThunderBorg`.
         :type command: int
-        :param data: The data to be sent to the I²C bus.
-        :type data: list
-        :raises ThunderBorgException: If the 'data' argument is the wrong
-                                      type.
-        """
-        assert isinstance(data, list), (
-            "Programming error, the 'data' argument must be of type list.")
-        assert hasattr(self, '_i2c_write'), (
-            "Programming error, the write stream has not been initialized")
-        assert hasattr(self._i2c_write, 'write'), (
-            "Programming error, the write stream object is not a stream.")
-
-        data.insert(0, command)
-
-        if six.PY2: # pragma: no cover
-            #  Either PY2 or PY3 can be tested at a given time.
-            data = ''.join([chr(byte) for byte in data])
-        else:
-            data = bytes(data)
+        :param data: The data to be sent to the I²C bus, it is only copied
+                     so the caller can safely reuse it.
+        :type data: list, bytes, or any bytes-like object
+        :raises IOError: If the write failed or the device is closed.
+        """
+        # Build the frame in the reusable transmit buffer, a longer frame
+        # just grows the buffer.
+        length = len(data) + 1
+        tx_buf = self._tx_buf
+        tx_buf[0] = command
+        tx_buf[1:length] = data
+        os.write(self._i2c_fd, memoryview(tx_buf)[:length])
+
+    @_bus_access
+    def _write_packed(self, packer, *values):
+        """
+        Write a fixed size frame to the `ThunderBorg`, the command and
+        data are packed into the reusable transmit buffer.
+
+        :param packer: The precompiled packer for the frame.
+        :type packer: struct.Struct
+        :param values: The command followed by its data.
+        :type values: int
+        :raises IOError: If the write failed or the device is closed.
+        """
+        tx_buf = self._tx_buf
+        packer.pack_into(tx_buf, 0, *values)
+        os.write(self._i2c_fd, memoryview(tx_buf)[:packer.size])
+
+    @_bus_access
+    def _write_many(self, frames):
+        """
+        Write several commands and their data to the `ThunderBorg`. Each
+        frame is still its own I²C message, but the messages are submitted
+        together in as few ``I2C_RDWR`` ioctls as the kernel allows.
+
+        :param frames: The `(command, data)` pairs to be sent to the I²C
+                       bus.
+        :type frames: list
+        :raises IOError: If the I²C transaction failed.
+        :raises ValueError: If the device is closed.
+        """
+        max_msgs = self._I2C_RDWR_MAX_MSGS
+
+        for start in range(0, len(frames), max_msgs):
+            chunk = frames[start:start + max_msgs]
+            msgs = (_I2cMsg * len(chunk))()
+            buffers = []
+
+            for idx, (command, data) in enumerate(chunk):
+                buf = (ctypes.c_uint8 * (len(data) + 1))(command, *data)
+                msgs[idx] = _I2cMsg(self._address, 0, len(buf), buf)
+                buffers.append(buf)
+
+            ioctl_data = _I2cRdwrIoctlData(msgs, len(chunk))
+            fcntl.ioctl(self._i2c_fd, self._I2C_RDWR, ioctl_data)
+
+    def _cmd_frame(self, command):
+        """
+        Return the transmit buffer holding just the command byte.
+        """
+        tx = self._CMD_FRAMES.get(command)
+        return (ctypes.c_uint8 * 1)(command) if tx is None else tx
 
+    def _transfer(self, ioctl_data, attempt, retry_count):
+        """
+        Run one ``I2C_RDWR`` transaction for a read. A failed transfer is
+        backed off and reported as incomplete unless it was the last
+        attempt, then the error is raised.
+
+        :param ioctl_data: The messages to transfer.
+        :type ioctl_data: _I2cRdwrIoctlData
+        :param attempt: The zero based attempt number.
+        :type attempt: int
+        :param retry_count: The total number of attempts.
+        :type retry_count: int
+        :rtype: `True` if the transfer completed else `False`.
+        :raises IOError: If the last attempt failed or the adapter does
+                         not support the transaction.
+        """
         try:
-            self._i2c_write.write(data)
-        except ValueError as e: # pragma: no cover
-            msg = "{}".format(e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+            fcntl.ioctl(self._i2c_fd, self._I2C_RDWR, ioctl_data)
+        except IOError as e:
+            if e.errno == errno.EOPNOTSUPP or attempt + 1 >= retry_count:
+                raise
+
+            time.sleep(self._I2C_RETRY_BACKOFF * (attempt + 1))
+            return False
+
+        return True
+
+    def _read_ioctl(self, command, length, rx_buf):
+        """
+        Build the ``I2C_RDWR`` transaction that writes the command and
+        reads the reply into `rx_buf`. The ctypes objects keep references
+        to the buffers they point at.
+        """
+        recv = (ctypes.c_uint8 * length).from_buffer(rx_buf)
+        msgs = (_I2cMsg * 2)(
+            _I2cMsg(self._address, 0, 1, self._cmd_frame(command)),
+            _I2cMsg(self._address, self._I2C_M_RD, length, recv))
+        return _I2cRdwrIoctlData(msgs, 2)
 
-    def _read(self, command, length, retry_count=3):
+    @_bus_access
+    def _read(self, command, length, retry_count=3, out=None):
         """
         Reads data from the `ThunderBorg`.
 
@@ -491,66 +1039,211 @@ class ThunderBorg(object):
         :type length: int
         :param retry_count: Number of times to retry the read. Default is 3.
         :type retry_count: int
-        :rtype: A list of bytes returned from the `ThunderBorg`.
-        :raises ThunderBorgException: If reading a command failed.
+        :param out: A buffer of at least `length` bytes to read into.
+                    Default is `None` to use the instance receive buffer.
+        :type out: bytearray
+        :rtype: A memoryview of the bytes returned from the `ThunderBorg`,
+                it is only valid until the next read into the same buffer.
+        :raises IOError: If the read failed or no reply matched the command.
+        :raises ValueError: If the device is closed.
+        """
+        # Write the command then read the reply in a single combined
+        # transaction (repeated start) instead of two separate syscalls.
+        # The reply is read straight into the reusable receive buffer and
+        # the transaction for it is only built once.
+        if out is None:
+            if length > len(self._rx_buf): # pragma: no cover
+                self._rx_buf = bytearray(length)
+                self._read_ioctls.clear()
+
+            rx_buf = self._rx_buf
+            ioctl_data = self._read_ioctls.get((command, length))
+
+            if ioctl_data is None:
+                ioctl_data = self._read_ioctl(command, length, rx_buf)
+                self._read_ioctls[(command, length)] = ioctl_data
+        else:
+            rx_buf = out
+            ioctl_data = self._read_ioctl(command, length, rx_buf)
+
+        # Retry if the reply is for a different command or the transfer
+        # failed, a reply that never matches is an error not data.
+        for attempt in range(retry_count):
+            if (self._transfer(ioctl_data, attempt, retry_count)
+                and command == rx_buf[0]):
+                break
+        else:
+            raise IOError(errno.EIO, f"No reply to command {command} after "
+                          f"{retry_count} attempts")
+
+        return memoryview(rx_buf)[:length]
+
+    @_bus_access
+    def _read_many(self, commands, length, retry_count=3):
         """
-        assert hasattr(self, '_i2c_read'), (
-            "Programming error, the read stream has not been initialized")
-        assert hasattr(self._i2c_read, 'read'), (
-            "Programming error, the read stream object is not a stream.")
+        Reads the replies to several commands from the `ThunderBorg` in a
+        single ``I2C_RDWR`` ioctl, one write/read message pair per command.
+        Adapters that only allow one read as the last message, such as the
+        Raspberry Pi ``i2c-bcm2835``, refuse this with ``EOPNOTSUPP``, from
+        then on each command is read on its own.
 
-        for i in range(retry_count):
-            self._write(command, [])
-            recv = self._i2c_read.read(length)
+        :param commands: Commands to send to the `ThunderBorg`.
+        :type commands: tuple
+        :param length: The number of bytes to read for each command.
+        :type length: int
+        :param retry_count: Number of times to retry the read. Default is 3.
+        :type retry_count: int
+        :rtype: A list with a bytearray reply for each command.
+        :raises IOError: If the read failed or no reply matched the commands.
+        """
+        if not self._combined_reads:
+            return self._read_each(commands, length, retry_count)
+
+        count = len(commands)
+        msgs = (_I2cMsg * (count * 2))()
+        buffers = []
+        replies = []
+
+        for idx, command in enumerate(commands):
+            tx = self._cmd_frame(command)
+            reply = bytearray(length)
+            rx = (ctypes.c_uint8 * length).from_buffer(reply)
+            msgs[idx * 2] = _I2cMsg(self._address, 0, 1, tx)
+            msgs[idx * 2 + 1] = _I2cMsg(self._address, self._I2C_M_RD,
+                                        length, rx)
+            buffers.extend((tx, rx))
+            replies.append(reply)
+
+        ioctl_data = _I2cRdwrIoctlData(msgs, count * 2)
+
+        for attempt in range(retry_count):
+            try:
+                done = self._transfer(ioctl_data, attempt, retry_count)
+            except IOError as e:
+                if e.errno != errno.EOPNOTSUPP:
+                    raise
 
-            # Split string/bytes
-            # b'\x99\x15\x00\x00\x00\x00' [153, 21, 0, 0, 0, 0]
-            if six.PY2: # pragma: no cover
-                # Either PY2 or PY3 can be tested at a given time.
-                data = [ord(bt) for bt in recv]
-            else:
-                data = [bt for bt in recv]
+                self._combined_reads = False
+                self._log.info("The I2C adapter does not support combined "
+                               "reads, reading each command on its own.")
+                return self._read_each(commands, length, retry_count)
 
-            if command == data[0]:
+            if done and all(command == reply[0]
+                            for command, reply in zip(commands, replies)):
                 break
+        else:
+            raise IOError(errno.EIO, f"No reply to commands {commands} "
+                          f"after {retry_count} attempts")
 
-        if len(data) <= 0: # pragma: no cover
-            msg = "I2C read for command '{}' failed.".format(command)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+        return replies
 
-        return data
+    def _read_each(self, commands, length, retry_count):
+        """
+        Reads the replies to several commands with one transaction per
+        command, the fallback of `_read_many`.
 
-    def _set_motor(self, level, fwd, rev):
-        if level < 0:
-            # Reverse
-            command = rev
-            pwm = -int(self._PWM_MAX * level)
-            pwm = self._PWM_MAX if pwm > self._PWM_MAX else pwm
+        :rtype: A list with a bytearray reply for each command.
+        :raises IOError: If a read failed or no reply matched its command.
+        """
+        return [bytearray(self._read(command, length, retry_count))
+                for command in commands]
+
+    def _cached_read(self, command):
+        """
+        Reads data from the `ThunderBorg` unless the command is being
+        polled in the background or the last reply to the same command is
+        still fresh according to `_READ_CACHE_TTL`.
+
+        :param command: Command to send to the `ThunderBorg`.
+        :type command: int
+        :rtype: A copy of the bytes returned from the `ThunderBorg`.
+        :raises ThunderBorgException: If reading a command failed.
+        """
+        now = time.monotonic()
+        polled = self._snapshot.get(command)
+
+        if polled is not None and now - polled[0] < self._poll_max_age:
+            return polled[1]
+
+        cached = self._read_cache.get(command)
+
+        group = self._READ_GROUPS.get(command)
+
+        if cached and now - cached[0] < self._READ_CACHE_TTL[command]:
+            recv = cached[1]
+        elif group:
+            replies = self._read_many(group, self._I2C_READ_LEN)
+
+            for cmd, reply in zip(group, replies):
+                self._read_cache[cmd] = (now, reply)
+
+            recv = self._read_cache[command][1]
         else:
-            # Forward / stopped
-            command = fwd
-            pwm = int(self._PWM_MAX * level)
-            pwm = self._PWM_MAX if pwm > self._PWM_MAX else pwm
+            recv = bytearray(self._read(command, self._I2C_READ_LEN))
+            self._read_cache[command] = (now, recv)
 
-        try:
-            self._write(command, [pwm])
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            motor = 1 if fwd == self.COMMAND_SET_A_FWD else 2
-            msg = "Failed sending motor {} drive level {}, {}".format(
-                motor, level, e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
-        except ValueError as e:
-            motor = 1 if fwd == self.COMMAND_SET_A_FWD else 2
-            msg = "Failed sending motor {} drive level {}, pwm: {}, {}".format(
-                motor, level, pwm, e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+        return recv
+
+    def _cached_read_many(self, commands):
+        """
+        Reads the replies to several commands from the `ThunderBorg`. The
+        replies that are polled or still fresh are reused and the rest are
+        read together in a single transaction.
+
+        :param commands: Commands to send to the `ThunderBorg`.
+        :type commands: tuple
+        :rtype: A list with the reply to each command.
+        :raises ThunderBorgException: If reading a command failed.
+        """
+        now = time.monotonic()
+        replies = {}
+
+        for command in commands:
+            recv = None
+            polled = self._snapshot.get(command)
+
+            if polled is not None and now - polled[0] < self._poll_max_age:
+                recv = polled[1]
+            else:
+                cached = self._read_cache.get(command)
 
+                if cached and now - cached[0] < self._READ_CACHE_TTL[command]:
+                    recv = cached[1]
+
+            if recv is not None:
+                replies[command] = recv
+
+        missing = [command for command in commands if command not in replies]
+
+        if missing:
+            for command, recv in zip(
+                    missing, self._read_many(missing, self._I2C_READ_LEN)):
+                self._read_cache[command] = (now, recv)
+                replies[command] = recv
+
+        return [replies[command] for command in commands]
+
+    def _motor_command(self, level, fwd, rev):
+        """
+        Convert a motor drive level into its command and PWM value.
+        """
+        # Reverse for negative levels else forward / stopped.
+        pwm_max = self._PWM_MAX
+        pwm = int(pwm_max * abs(level))
+        return rev if level < 0 else fwd, pwm_max if pwm > pwm_max else pwm
+
+    def _motor_frame(self, level, fwd, rev):
+        """
+        Convert a motor drive level into its command and data.
+        """
+        command, pwm = self._motor_command(level, fwd, rev)
+        return command, [pwm]
+
+    def _set_motor(self, level, fwd, rev):
+        self._write_packed(self._PACK_MOTOR,
+                           *self._motor_command(level, fwd, rev))
+
+    @_i2c_guard("Failed sending motor 1 drive level {1}, {0}")
     def set_motor_one(self, level):
         """
         Set the drive level for motor one.
@@ -566,6 +1259,7 @@ class ThunderBorg(object):
         """
         self._set_motor(level, self.COMMAND_SET_A_FWD, self.COMMAND_SET_A_REV)
 
+    @_i2c_guard("Failed sending motor 2 drive level {1}, {0}")
     def set_motor_two(self, level):
         """
         Set the drive level for motor two.
@@ -581,6 +1275,7 @@ class ThunderBorg(object):
         """
         self._set_motor(level, self.COMMAND_SET_B_FWD, self.COMMAND_SET_B_REV)
 
+    @_i2c_guard("Failed sending motor 1 and 2 drive level {1}, {0}")
     def set_both_motors(self, level):
         """
         Set the drive level for motor two.
@@ -603,31 +1298,28 @@ class ThunderBorg(object):
 
         :param command: 
         """
-        motor = 1 if command == self.COMMAND_GET_A else 2
+        return self._motor_level(command,
+                                 self._read(command, self._I2C_READ_LEN))
 
-        try:
-            recv = self._read(command, self._I2C_READ_LEN)
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = "Failed reading motor %d drive level, {}".format(motor, e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
-
-        level = float(recv[2]) / self._PWM_MAX
+    def _motor_level(self, command, recv):
+        """
+        Convert the reply to a motor `command` into the drive level.
+        """
+        level = recv[2] * self._INV_PWM_MAX
         direction = recv[1]
 
         if direction == self.COMMAND_VALUE_REV:
             level = -level
         elif direction != self.COMMAND_VALUE_FWD: # pragma: no cover
-            msg = ("Invalid command '{:02d}' while getting drive level "
-                   "for motor {:d}.").format(direction, motor)
+            motor = self._MOTOR_ID[command]
+            msg = (f"Invalid command '{direction:02d}' while getting drive "
+                   f"level for motor {motor:d}.")
             self._log.error(msg)
             raise ThunderBorgException(msg)
 
         return level
 
+    @_i2c_guard("Failed reading motor 1 drive level, {}")
     def get_motor_one(self):
         """
         Get the drive level of motor one.
@@ -638,6 +1330,7 @@ class ThunderBorg(object):
         """
         return self._get_motor(self.COMMAND_GET_A)
 
+    @_i2c_guard("Failed reading motor 2 drive level, {}")
     def get_motor_two(self):
         """
         Get the drive level of motor two.
@@ -648,6 +1341,21 @@ class ThunderBorg(object):
         """
         return self._get_motor(self.COMMAND_GET_B)
 
+    @_i2c_guard("Failed reading the motor drive levels, {}")
+    def get_motors(self):
+        """
+        Get the drive levels of both motors in a single I²C transaction.
+
+        :rtype: Return a tuple of `(level_one, level_two)`.
+        :raises KeyboardInterrupt: Keyboard interrupt.
+        :raises ThunderBorgException: An error happened on a stream.
+        """
+        commands = self._MOTOR_COMMANDS
+        recv_one, recv_two = self._read_many(commands, self._I2C_READ_LEN)
+        return (self._motor_level(commands[0], recv_one),
+                self._motor_level(commands[1], recv_two))
+
+    @_i2c_guard("Failed sending motors halt command, {}")
     def halt_motors(self):
         """
         Halt both motors. Should be used when ending a program or
@@ -657,32 +1365,76 @@ class ThunderBorg(object):
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        try:
-            self._write(self.COMMAND_ALL_OFF, [0])
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = "Failed sending motors halt command, {}".format(e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
-        else:
-            self._log.debug("Both motors were halted successfully.")
+        self._write(self.COMMAND_ALL_OFF, b'\x00')
 
-    def _set_led(self, command, r, g, b):
-        level_r = max(0, min(self._PWM_MAX, int(r * self._PWM_MAX)))
-        level_g = max(0, min(self._PWM_MAX, int(g * self._PWM_MAX)))
-        level_b = max(0, min(self._PWM_MAX, int(b * self._PWM_MAX)))
+        self._log.debug("Both motors were halted successfully.")
 
-        try:
-            self._write(command, [level_r, level_g, level_b])
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = "Failed sending color to the ThunderBorg LED one."
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+    @_i2c_guard("Failed sending the ThunderBorg state, {}")
+    def apply_state(self, led_one=None, led_two=None, motor_one=None,
+                    motor_two=None):
+        """
+        Set any of the LEDs and motors together. All the given values are
+        sent to the `ThunderBorg` in a single I²C transaction instead of
+        one per setter call.
+
+        .. note::
+
+           Executing ``tb.apply_state(led_one=(1, 0, 0), motor_one=0.5,
+           motor_two=0.5)`` will set LED one to red and both motors to
+           50% forward, LED two is left unchanged.
+
+        :param led_one: The `(r, g, b)` color for LED one, see
+                        `set_led_one`. Default is `None` to leave it
+                        unchanged.
+        :type led_one: tuple
+        :param led_two: The `(r, g, b)` color for LED two, see
+                        `set_led_two`. Default is `None` to leave it
+                        unchanged.
+        :type led_two: tuple
+        :param motor_one: The drive level for motor one, see
+                          `set_motor_one`. Default is `None` to leave it
+                          unchanged.
+        :type motor_one: float
+        :param motor_two: The drive level for motor two, see
+                          `set_motor_two`. Default is `None` to leave it
+                          unchanged.
+        :type motor_two: float
+        :raises KeyboardInterrupt: Keyboard interrupt.
+        :raises ThunderBorgException: An error happened on a stream.
+        """
+        frames = []
+
+        if led_one is not None:
+            frames.append(self._led_frame(self.COMMAND_SET_LED1, *led_one))
+
+        if led_two is not None:
+            frames.append(self._led_frame(self.COMMAND_SET_LED2, *led_two))
+
+        if motor_one is not None:
+            frames.append(self._motor_frame(
+                motor_one, self.COMMAND_SET_A_FWD, self.COMMAND_SET_A_REV))
+
+        if motor_two is not None:
+            frames.append(self._motor_frame(
+                motor_two, self.COMMAND_SET_B_FWD, self.COMMAND_SET_B_REV))
+
+        if frames:
+            self._write_many(frames)
+
+    def _led_frame(self, command, r, g, b):
+        """
+        Convert an LED color into its command and data.
+        """
+        pwm_max = self._PWM_MAX
+        level_r = 0 if r <= 0 else (pwm_max if r >= 1 else int(r * pwm_max))
+        level_g = 0 if g <= 0 else (pwm_max if g >= 1 else int(g * pwm_max))
+        level_b = 0 if b <= 0 else (pwm_max if b >= 1 else int(b * pwm_max))
+        return command, [level_r, level_g, level_b]
+
+    @_i2c_guard("Failed sending color to the ThunderBorg LEDs, {}")
+    def _set_led(self, command, r, g, b):
+        command, data = self._led_frame(command, r, g, b)
+        self._write_packed(self._PACK_LED, command, *data)
 
     def set_led_one(self, r, g, b):
         """
@@ -750,23 +1502,68 @@ class ThunderBorg(object):
         """
         self._set_led(self.COMMAND_SET_LEDS, r, g, b)
 
-    def _get_led(self, command):
-        try:
-            recv = self._read(command, self._I2C_READ_LEN)
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            led = 1 if command == self.COMMAND_GET_LED1 else 2
-            msg = "Failed to read ThunderBorg LED {} color, {}".format(led, e)
+    @_i2c_guard("Failed sending a color sequence to the ThunderBorg LEDs, {}")
+    def set_led_sequence(self, colors, period, led=None):
+        """
+        Animate the ThunderBorg LEDs through a sequence of colors, one color
+        every `period` seconds. All the colors are converted before the
+        first one is sent and a run of identical colors is sent only once.
+
+        .. note::
+
+           Executing ``tb.set_led_sequence([(1, 0, 0), (0, 1, 0),
+           (0, 0, 1)], 0.5, led=1)`` will show red, green, then blue on
+           LED one for half a second each.
+
+        :param colors: The RGB colors, each range is between 0.0 and 1.0.
+        :type colors: list
+        :param period: The number of seconds each color is shown.
+        :type period: float
+        :param led: The LED number, 1 or 2. Default is `None` for both
+                    LEDs.
+        :type led: int
+        :raises KeyboardInterrupt: Keyboard interrupt.
+        :raises ThunderBorgException: An error happened on a stream or an
+                                      invalid LED number was provided.
+        """
+        commands = {None: self.COMMAND_SET_LEDS,
+                    1: self.COMMAND_SET_LED1,
+                    2: self.COMMAND_SET_LED2}
+
+        if led not in commands:
+            msg = f"Invalid LED number {led}, must be 1, 2, or None."
             self._log.error(msg)
             raise ThunderBorgException(msg)
-        else:
-            r = recv[1] / float(self._PWM_MAX)
-            g = recv[2] / float(self._PWM_MAX)
-            b = recv[3] / float(self._PWM_MAX)
-            return r, g, b
 
+        command = commands[led]
+        # Each entry is the data and the number of periods it is shown.
+        frames = []
+
+        for r, g, b in colors:
+            data = bytes(self._led_frame(command, r, g, b)[1])
+
+            if frames and frames[-1][0] == data:
+                frames[-1][1] += 1
+            else:
+                frames.append([data, 1])
+
+        deadline = time.monotonic()
+
+        for data, count in frames:
+            self._write(command, data)
+            deadline += period * count
+            delay = deadline - time.monotonic()
+
+            if delay > 0:
+                time.sleep(delay)
+
+    def _get_led(self, command):
+        recv = self._read(command, self._I2C_READ_LEN)
+        inv_pwm_max = self._INV_PWM_MAX
+        return (recv[1] * inv_pwm_max, recv[2] * inv_pwm_max,
+                recv[3] * inv_pwm_max)
+
+    @_i2c_guard("Failed to read ThunderBorg LED 1 color, {}")
     def get_led_one(self):
         """
         Get the current RGB color of the ThunderBorg LED number one.
@@ -784,6 +1581,7 @@ class ThunderBorg(object):
         """
         return self._get_led(self.COMMAND_GET_LED1)
 
+    @_i2c_guard("Failed to read ThunderBorg LED 2 color, {}")
     def get_led_two(self):
         """
         Get the current RGB color of the ThunderBorg LED number two.
@@ -801,6 +1599,7 @@ class ThunderBorg(object):
         """
         return self._get_led(self.COMMAND_GET_LED2)
 
+    @_i2c_guard("Failed to send LEDs state change, {}")
     def set_led_battery_state(self, state):
         """
         Change from the default LEDs state (set with `set_led_one` and/or
@@ -820,18 +1619,11 @@ class ThunderBorg(object):
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        level = self.COMMAND_VALUE_ON if state else self.COMMAND_VALUE_OFF
-
-        try:
-            self._write(self.COMMAND_SET_LED_BATT_MON, [level])
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = "Failed to send LEDs state change, {}".format(e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+        self._read_cache.pop(self.COMMAND_GET_LED_BATT_MON, None)
+        self._write(self.COMMAND_SET_LED_BATT_MON,
+                    self._STATE_BYTES[bool(state)])
 
+    @_i2c_guard("Failed reading LED state, {}")
     def get_led_battery_state(self):
         """
         Get the state of the LEDs between the default and the battery
@@ -842,20 +1634,12 @@ class ThunderBorg(object):
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        try:
-            recv = self._read(self.COMMAND_GET_LED_BATT_MON,
-                              self._I2C_READ_LEN)
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = "Failed reading LED state, {}".format(e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+        recv = self._cached_read(self.COMMAND_GET_LED_BATT_MON)
 
-        return False if recv[1] == self.COMMAND_VALUE_OFF else True
+        return recv[1] != self.COMMAND_VALUE_OFF
 
-    def set_comms_failsafe(self, state):
+    @_i2c_guard("Failed sending communications failsafe state, {}")
+    def set_comms_failsafe(self, state, force=False):
         """
         Set the state of the motor failsafe. The default failsafe state
         of ``False`` will cause the motors to continuously run without a
@@ -863,25 +1647,32 @@ class ThunderBorg(object):
         after 1/4 of a second unless it is sent the speed command every
         1/4 of a second.
 
+        .. note::
+
+           Setting the same state that was last set by this instance is
+           skipped unless `force` is ``True``.
+
         :param state: If set to ``True`` failsafe is enabled, else if set
                       to ``False`` failsafe is disabled. Default is
                       disables when powered on.
         :type state: bool
+        :param force: Send the state even if it is unchanged, use this if
+                      the board may have been power cycled. Default is
+                      ``False``.
+        :type force: bool
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        level = self.COMMAND_VALUE_ON if state else self.COMMAND_VALUE_OFF
+        state = bool(state)
 
-        try:
-            self._write(self.COMMAND_SET_FAILSAFE, [level])
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = "Failed sending communications failsafe state, {}".format(e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+        if state is self._failsafe_state and not force:
+            return
+
+        self._read_cache.pop(self.COMMAND_GET_FAILSAFE, None)
+        self._write(self.COMMAND_SET_FAILSAFE, self._STATE_BYTES[state])
+        self._failsafe_state = state
 
+    @_i2c_guard("Failed reading communications failsafe state, {}")
     def get_comms_failsafe(self):
         """
         Get the failsafe state.
@@ -890,33 +1681,28 @@ class ThunderBorg(object):
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        try:
-            recv = self._read(self.COMMAND_GET_FAILSAFE, self._I2C_READ_LEN)
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = "Failed reading communications failsafe state, {}".format(e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+        recv = self._cached_read(self.COMMAND_GET_FAILSAFE)
 
-        return False if recv[1] == self.COMMAND_VALUE_OFF else True
+        return recv[1] != self.COMMAND_VALUE_OFF
 
-    def _get_drive_fault(self, command):
-        try:
-            recv = self._read(command, self._I2C_READ_LEN)
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            motor = 1 if command == self.COMMAND_GET_DRIVE_A_FAULT else 2
-            msg = ("Failed reading the drive fault state for "
-                   "motor {}, {}").format(motor, e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+    @_i2c_guard("Failed reading the drive fault states, {}")
+    def get_drive_faults(self):
+        """
+        Read the motor drive fault states for both motors in a single I²C
+        transaction. See `get_drive_fault_one` for what the faults mean.
 
-        return False if recv[1] == self.COMMAND_VALUE_OFF else True
+        :rtype: Return a tuple of `(fault_one, fault_two)`, each is `False`
+                if there are no problems else `True` if a fault has been
+                detected.
+        :raises KeyboardInterrupt: Keyboard interrupt.
+        :raises ThunderBorgException: An error happened on a stream.
+        """
+        off = self.COMMAND_VALUE_OFF
+        recv_one = self._cached_read(self.COMMAND_GET_DRIVE_A_FAULT)
+        recv_two = self._cached_read(self.COMMAND_GET_DRIVE_B_FAULT)
+        return recv_one[1] != off, recv_two[1] != off
 
+    @_i2c_guard("Failed reading the drive fault state for motor 1, {}")
     def get_drive_fault_one(self):
         """
         Read the motor drive fault state for motor one.
@@ -956,9 +1742,11 @@ class ThunderBorg(object):
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        return self._get_drive_fault(self.COMMAND_GET_DRIVE_A_FAULT)
+        recv = self._cached_read(self.COMMAND_GET_DRIVE_A_FAULT)
+        return recv[1] != self.COMMAND_VALUE_OFF
 
 
+    @_i2c_guard("Failed reading the drive fault state for motor 2, {}")
     def get_drive_fault_two(self):
         """
         Read the motor drive fault state for motor two.
@@ -998,33 +1786,74 @@ class ThunderBorg(object):
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        return self._get_drive_fault(self.COMMAND_GET_DRIVE_B_FAULT)
+        recv = self._cached_read(self.COMMAND_GET_DRIVE_B_FAULT)
+        return recv[1] != self.COMMAND_VALUE_OFF
 
+    @_i2c_guard("Failed reading battery level, {}")
     def get_battery_voltage(self):
         """
         Read the current battery level from the main input.
 
+        .. note::
+
+           If the instance was created with a `voltage_ewma_alpha` the
+           smoothed voltage is returned. Each new sample from the board is
+           weighted by `voltage_ewma_alpha`, a cached or polled sample is
+           only counted once.
+
         :rtype: Return a voltage value based on the 3.3 V rail as a
                 reference.
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        try:
-            recv = self._read(self.COMMAND_GET_BATT_VOLT, self._I2C_READ_LEN)
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = "Failed reading battery level, {}".format(e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+        return self._voltage(self._cached_read(self.COMMAND_GET_BATT_VOLT))
+
+    def _voltage(self, recv):
+        """
+        Convert a battery voltage reply into volts, smoothing it if the
+        instance was created with a `voltage_ewma_alpha`.
+        """
+        alpha = self._volt_alpha
+
+        if alpha is None:
+            raw = (recv[1] << 8) | recv[2]
+            return raw * self._VOLT_SCALE + self._VOLTAGE_PIN_CORRECTION
+
+        # Every fresh reply is a new object, cached replies are not.
+        if recv is not self._volt_sample:
+            self._volt_sample = recv
+            raw = (recv[1] << 8) | recv[2]
+            voltage = raw * self._VOLT_SCALE + self._VOLTAGE_PIN_CORRECTION
 
-        raw = (recv[1] << 8) + recv[2]
-        level = float(raw) / self.COMMAND_ANALOG_MAX
-        level *= self._VOLTAGE_PIN_MAX
-        return level + self._VOLTAGE_PIN_CORRECTION
+            if self._volt_ewma is None:
+                self._volt_ewma = voltage
+            else:
+                self._volt_ewma += alpha * (voltage - self._volt_ewma)
+
+        return self._volt_ewma
+
+    @_i2c_guard("Failed reading the ThunderBorg status, {}")
+    def get_status(self):
+        """
+        Read the drive faults, the communications failsafe state, and the
+        battery voltage together. The values that are not polled or
+        cached are read in a single I²C transaction instead of one per
+        getter.
 
-    def set_battery_monitoring_limits(self, minimum, maximum):
+        :rtype: Return a `ThunderBorgStatus` of `(fault_one, fault_two,
+                failsafe, voltage)`, see `get_drive_fault_one`,
+                `get_comms_failsafe`, and `get_battery_voltage`.
+        :raises KeyboardInterrupt: Keyboard interrupt.
+        :raises ThunderBorgException: An error happened on a stream.
+        """
+        off = self.COMMAND_VALUE_OFF
+        fault_one, fault_two, failsafe, voltage = self._cached_read_many(
+            self._STATUS_COMMANDS)
+        return ThunderBorgStatus(fault_one[1] != off, fault_two[1] != off,
+                                 failsafe[1] != off, self._voltage(voltage))
+
+    @_i2c_guard("Failed sending battery monitoring limits, {}")
+    def set_battery_monitoring_limits(self, minimum, maximum, force=False):
         """
         Set the battery monitoring limits used for setting the LED color.
 
@@ -1034,31 +1863,209 @@ class ThunderBorg(object):
               yellow half way, and full green at maximum or higher.
            2. These values are stored in EEPROM and reloaded when the board
               is powered.
+           3. Setting the same limits that were last set by this instance
+              is skipped, avoiding the EEPROM write and its delay, unless
+              `force` is ``True``.
+           4. The call returns as soon as the limits are sent. The board
+              is left alone for 0.2 seconds while it stores them and the
+              limits are then read back, the next call that uses the I²C
+              bus waits for that, at most 0.25 seconds from the write, see
+              `sync_eeprom`.
 
         :param minimum: Value between 0.0 and 36.3 Volts.
         :type minimum: float
         :param maximum: Value between 0.0 and 36.3 Volts.
         :type maximum: float
+        :param force: Send the limits even if they are unchanged, use this
+                      if the board may have been power cycled. Default is
+                      ``False``.
+        :type force: bool
+        :raises KeyboardInterrupt: Keyboard interrupt.
+        :raises ThunderBorgException: An error happened on a stream.
+        """
+        level_min = minimum / self._VOLTAGE_PIN_MAX
+        level_max = maximum / self._VOLTAGE_PIN_MAX
+        level_min = _clip8(int(level_min * 0xFF))
+        level_max = _clip8(int(level_max * 0xFF))
+
+        if (level_min, level_max) == self._last_batt_limits and not force:
+            return
+
+        self._read_cache.pop(self.COMMAND_GET_BATT_LIMITS, None)
+        limits = bytes((level_min, level_max))
+
+        # Nothing may use the bus between the write and marking it pending.
+        with self._io_lock:
+            self._write(self.COMMAND_SET_BATT_LIMITS, limits)
+            self._eeprom_pending = (self.COMMAND_GET_BATT_LIMITS, limits,
+                                    time.monotonic())
+
+        self._last_batt_limits = (level_min, level_max)
+
+    @_i2c_guard("Failed waiting for the EEPROM write, {}")
+    def sync_eeprom(self):
+        """
+        Wait until the board has stored the last values written to its
+        EEPROM, at most 0.25 seconds. Any other call that uses the I²C bus
+        does this first, so it is only needed to control when the wait
+        happens.
+
+        :rtype: `True` if the values were stored or nothing was pending,
+                `False` if the wait timed out.
+        :raises KeyboardInterrupt: Keyboard interrupt.
+        :raises ThunderBorgException: An error happened on a stream.
+        """
+        with self._io_lock:
+            return self._sync_eeprom()
+
+    async def set_battery_monitoring_limits_async(self, minimum, maximum,
+                                                  force=False):
+        """
+        Set the battery monitoring limits then wait for them to be stored
+        without blocking the event loop. This is the preferred form inside
+        coroutines, see `set_battery_monitoring_limits`.
+
+        :param minimum: Value between 0.0 and 36.3 Volts.
+        :type minimum: float
+        :param maximum: Value between 0.0 and 36.3 Volts.
+        :type maximum: float
+        :param force: Send the limits even if they are unchanged. Default
+                      is ``False``.
+        :type force: bool
+        :rtype: `True` if the limits were stored, `False` if the wait
+                timed out.
+        :raises KeyboardInterrupt: Keyboard interrupt.
+        :raises ThunderBorgException: An error happened on a stream.
+        """
+        # Wait here for an earlier write, the setter would block the event
+        # loop waiting for it.
+        await self.sync_eeprom_async()
+        self.set_battery_monitoring_limits(minimum, maximum, force=force)
+        return await self.sync_eeprom_async()
+
+    @_i2c_guard("Failed waiting for the EEPROM write, {}")
+    async def sync_eeprom_async(self):
+        """
+        Same as `sync_eeprom` but sleeps with `asyncio.sleep` between the
+        checks, so other coroutines keep running while the board stores
+        the values.
+
+        :rtype: `True` if the values were stored or nothing was pending,
+                `False` if the wait timed out.
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        level_min = float(minimum) / self._VOLTAGE_PIN_MAX
-        level_max = float(maximum) / self._VOLTAGE_PIN_MAX
-        level_min = max(0, min(0xFF, int(level_min * 0xFF)))
-        level_max = max(0, min(0xFF, int(level_max * 0xFF)))
+        while True:
+            pending = self._eeprom_pending
+
+            if pending is None:
+                return True
+
+            delay = pending[2] + self._EEPROM_SETTLE - time.monotonic()
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            with self._io_lock:
+                # Another caller finished the wait or wrote again.
+                if self._eeprom_pending is not pending:
+                    continue
+
+                # Cleared while checking so the read does not wait on
+                # itself, it is restored before the lock is released so
+                # it stays pending for other callers between the checks.
+                self._eeprom_pending = None
+                stored = timed_out = False
+
+                try:
+                    stored = self._eeprom_stored(*pending[:2])
+                    timed_out = not stored and (
+                        time.monotonic() >= pending[2] + self._EEPROM_TIMEOUT)
+                finally:
+                    if not (stored or timed_out):
+                        self._eeprom_pending = pending
+
+            if stored:
+                return True
+
+            if timed_out:
+                self._log.warning("Timed out waiting for the values of "
+                                  "command %d to be stored.", pending[0])
+                return False
+
+            await asyncio.sleep(self._EEPROM_POLL)
+
+    def _sync_eeprom(self):
+        """
+        Wait for the pending EEPROM write, if any, and clear it first so
+        the reads done while waiting do not wait on themselves.
+
+        :rtype: `True` if the values were stored or nothing was pending,
+                `False` if the wait timed out.
+        """
+        pending, self._eeprom_pending = self._eeprom_pending, None
+
+        if pending is None or self._wait_for_eeprom(*pending):
+            return True
+
+        self._log.warning("Timed out waiting for the values of command %d "
+                          "to be stored.", pending[0])
+        return False
+
+    def _wait_for_eeprom(self, command, expected, written):
+        """
+        Wait until `_EEPROM_SETTLE` seconds have passed since the EEPROM
+        write, then poll the `ThunderBorg` until it answers `command` with
+        the `expected` data. The read back only confirms the board took
+        the values, the settle time is what keeps the bus quiet while the
+        EEPROM is written.
+
+        :param command: The command that reads back the stored values.
+        :type command: int
+        :param expected: The data the reply should hold.
+        :type expected: bytes
+        :param written: The `time.monotonic` time of the write.
+        :type written: float
+        :rtype: `True` if the values were read back before the timeout
+                else `False`.
+        """
+        delay = written + self._EEPROM_SETTLE - time.monotonic()
 
+        # Any settle time the caller already spent elsewhere is not
+        # waited for again.
+        if delay > 0:
+            time.sleep(delay)
+
+        deadline = written + self._EEPROM_TIMEOUT
+
+        while not self._eeprom_stored(command, expected):
+            if time.monotonic() >= deadline:
+                return False
+
+            time.sleep(self._EEPROM_POLL)
+
+        return True
+
+    def _eeprom_stored(self, command, expected):
+        """
+        Check once if the `ThunderBorg` answers `command` with the
+        `expected` data.
+
+        :rtype: `True` if the values were read back else `False`.
+        :raises ValueError: If the device is closed.
+        """
+        # Read into a buffer of its own, the wait can run in the poller
+        # thread and must not overwrite the caller's reply.
         try:
-            self._write(self.COMMAND_SET_BATT_LIMITS, [level_min, level_max])
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = "Failed sending battery monitoring limits, {}".format(e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
-        else:
-            time.sleep(0.2) # Wait for EEPROM write to complete
+            recv = self._read(command, self._I2C_READ_LEN, retry_count=1,
+                              out=bytearray(self._I2C_READ_LEN))
+        except IOError:
+            return False # The board is still busy.
 
+        return recv[0] == command and recv[1:len(expected) + 1] == expected
+
+    @_i2c_guard("Failed reading battery monitoring limits, {}")
     def get_battery_monitoring_limits(self):
         """
         Read the current battery monitoring limits used for setting the
@@ -1074,22 +2081,12 @@ class ThunderBorg(object):
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        try:
-            recv = self._read(self.COMMAND_GET_BATT_LIMITS, self._I2C_READ_LEN)
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = "Failed reading battery monitoring limits, {}".format(e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+        recv = self._cached_read(self.COMMAND_GET_BATT_LIMITS)
 
-        level_min = float(recv[1]) / 0xFF
-        level_max = float(recv[2]) / 0xFF
-        level_min *= self._VOLTAGE_PIN_MAX
-        level_max *= self._VOLTAGE_PIN_MAX
-        return level_min, level_max
+        scale = self._BATT_LIMIT_SCALE
+        return recv[1] * scale, recv[2] * scale
 
+    @_i2c_guard("Failed sending binary word for the external LEDs, {}")
     def write_external_led_word(self, b0, b1, b2, b3):
         """
         Write low level serial LED 32 bit word to set multiple LED devices
@@ -1112,22 +2109,11 @@ class ThunderBorg(object):
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        b0 = max(0, min(self._PWM_MAX, int(b0)))
-        b1 = max(0, min(self._PWM_MAX, int(b1)))
-        b2 = max(0, min(self._PWM_MAX, int(b2)))
-        b3 = max(0, min(self._PWM_MAX, int(b3)))
-
-        try:
-            self._write(self.COMMAND_WRITE_EXTERNAL_LED, [b0, b1, b2, b3])
-        except KeyboardInterrupt as e: # pragma: no cover
-            self._log.warning("Keyboard interrupt, %s", e)
-            raise e
-        except IOError as e: # pragma: no cover
-            msg = ("Failed sending binary word for the external LEDs, {}"
-                   ).format(e)
-            self._log.error(msg)
-            raise ThunderBorgException(msg)
+        self._write_packed(self._PACK_EXTERNAL_LED,
+                           self.COMMAND_WRITE_EXTERNAL_LED, _to_byte(b0),
+                           _to_byte(b1), _to_byte(b2), _to_byte(b3))
 
+    @_i2c_guard("Failed sending colors for the external LEDs, {}")
     def set_external_led_colors(self, colors):
         """
         Takes a set of RGB values to set multiple LED devices like
@@ -1147,9 +2133,16 @@ class ThunderBorg(object):
         :raises KeyboardInterrupt: Keyboard interrupt.
         :raises ThunderBorgException: An error happened on a stream.
         """
-        # Send the start marker
-        self.write_external_led_word(0, 0, 0, 0)
-
-        # Send each color in turn
-        for r, g, b in colors:
-            self.write_external_led_word(255, 255 * b, 255 * g, 255 * r)
+        command = self.COMMAND_WRITE_EXTERNAL_LED
+        pwm_max = self._PWM_MAX
+        # Scale and clamp all the colors in one pass before touching the
+        # bus, the first frame is the start marker. All the frames are
+        # then handed to the kernel in as few ioctls as possible.
+        frames = [(command, [0, 0, 0, 0])]
+        frames.extend((command, [pwm_max,
+                                 _clip8(int(pwm_max * b)),
+                                 _clip8(int(pwm_max * g)),
+                                 _clip8(int(pwm_max * r))])
+                      for r, g, b in colors)
+
+        self._write_many(frames)
@@ -40,7 +40,6 @@ Exit values
 """
 
 # Core modules
-from __future__ import print_function
 import errno
 import fcntl
 import io